@@ -1,4 +1,7 @@
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from pyarabic.araby import (
     ALEF,
@@ -15,9 +18,96 @@ from pyarabic.araby import (
     SUKUN,
     WAW,
     YEH,
-    strip_tashkeel,
 )
 
+# Converter used by prepare_texts worker processes (set once per process)
+_worker_converter = None
+
+
+def _init_worker(converter):
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _prepare_in_worker(text, saturate, muqayyad):
+    return _worker_converter.prepare_text(text, saturate=saturate, muqayyad=muqayyad)
+
+
+class _KeepTable(dict):
+    """str.translate table that keeps only the given characters.
+
+    Entries are filled lazily, so any code point seen in the input is handled.
+    """
+
+    def __init__(self, keep):
+        super().__init__()
+        self._keep = frozenset(map(ord, keep))
+
+    def __missing__(self, codepoint):
+        value = codepoint if codepoint in self._keep else None
+        self[codepoint] = value
+        return value
+
+
+class _ChangeList(dict):
+    """CHANGE_LST mapping that reports every modification to its owner.
+
+    The converter keeps indexes and caches derived from CHANGE_LST, so direct
+    writes (e.g. `converter.CHANGE_LST[word] = spelling`) must refresh them too.
+    """
+
+    def __init__(self, on_change, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+
+    def __reduce__(self):
+        # Rebuild with all items first and attach the callback last, so copying or
+        # unpickling never notifies a half-restored converter
+        return (type(self), (None, dict(self)), {"_on_change": self._on_change})
+
+    def _changed(self):
+        if self._on_change is not None:
+            self._on_change()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):  # type: ignore[misc]
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key, *default):
+        missing = key not in self
+        value = super().pop(key, *default)
+        if not missing:
+            self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
 
 class ArudiConverter:
     def __init__(self):
@@ -31,8 +121,27 @@ class ArudiConverter:
             self.harakat + self.sukun + self.mostly_saken + self.tnween_chars + self.shadda_chars + self.all_chars
         )
 
-        # Word replacements for Arudi writing
-        self.CHANGE_LST = {
+        # Frozen sets for O(1) membership checks in the per-character loops
+        self._harakat_set = frozenset(self.harakat)
+        self._sukun_set = frozenset(self.sukun)
+        self._mostly_saken_set = frozenset(self.mostly_saken)
+        self._tnween_set = frozenset(self.tnween_chars)
+        self._shadda_set = frozenset(self.shadda_chars)
+        self._all_chars_set = frozenset(self.all_chars)
+        self._keep_prem = _KeepTable(self.prem_chars)
+        self._keep_prem[ord(ALEF_MADDA)] = "ءَا"  # Madda -> Hamza + Fatha + Alif
+        self._alef_like_set = frozenset([ALEF, ALEF_MAKSURA])
+        # Ashba' (saturation) of the final vowel: letter appended, or replacing the Noon of tanween
+        self._ashba_append = {KASRA: "ي", FATHA: "ا", DAMMA: "و"}
+        self._ashba_replace_last = {KASRATAN: "ي", DAMMATAN: "و"}
+        # Clitic prefixes allowed before a CHANGE_LST word, with their vowels
+        self._vocalized_prefixes = {
+            "و": "وَ", "ف": "فَ", "ك": "كَ", "ب": "بِ", "ل": "لِ",
+            "وب": "وَبِ", "فك": "فَكَ", "ول": "وَلِ", "فل": "فَلِ",
+        }
+
+        # Word replacements for Arudi writing (edits refresh the derived index)
+        self.CHANGE_LST = _ChangeList(self._change_lst_changed, {
             "هذا": "هَاذَا",
             "هذه": "هَاذِه",
             "هذان": "هَاذَان",
@@ -64,7 +173,72 @@ class ArudiConverter:
             "آه": "أَاهِ",
             "هو": "هْوَ",
             "هي": "هْيَ",
-        }
+        })
+
+        # Character-class strings shared by the patterns and tables below
+        cc_harakat = "".join(self.harakat)
+        cc_tnween = "".join(self.tnween_chars)
+        cc_shadda = "".join(self.shadda_chars)
+        cc_removable = cc_harakat + "".join(self.sukun) + cc_tnween
+        cc_all_tashkeel = cc_removable + cc_shadda
+        harakat_pattern = f"[{cc_harakat}{cc_tnween}]"
+
+        # Precompiled regex patterns (built once instead of on every call)
+        # Single-pass normalization: ligatures, Alif (incl. Dagger Alif) orthography and Shadda order
+        self._re_normalize = re.compile(
+            "|".join(
+                [
+                    f"(?P<ligature>[ﻻﻷﻹﻵ])(?:(?P<ligature_haraka>{harakat_pattern})"
+                    f"|[{ALEF}\u0670][{cc_harakat}]?(?P<ligature_tanween>{FATHATAN}))?",
+                    f"[{ALEF}\u0670][{cc_harakat}]?(?P<alef_tanween>{FATHATAN})",
+                    f"[{ALEF}\u0670](?P<alef_haraka>[{cc_harakat}])",
+                    f"(?P<haraka>{harakat_pattern})(?P<shadda>[{cc_shadda}])",
+                    "(?P<dagger_alef>\u0670)",
+                ]
+            )
+        )
+        self._lig_map = {"ﻻ": "ا", "ﻷ": "أ", "ﻹ": "إ", "ﻵ": "آ"}
+        self._re_wasl_longvowel = re.compile(r"([^\s]\S*)([اىيو])\s+ا")
+        self._re_wasl_space_alif = re.compile(r"\s+ا")
+        # Prefixes: Fa/Wa/Ba/Ta/Kaf
+        self._re_allah_prefix = re.compile(f"([\u0641\u0648\u0628\u062a\u0643])([{cc_harakat}]?)ا(لل)")
+        self._re_prefix_al = re.compile(f"(^|\\s)([فوبتك])([{cc_harakat}])?ال")
+        self._re_sun = re.compile(" ال([تثدذرزسشصضطظلن])")
+        # Ordered literal substitutions for _process_specials_before
+        self._common_subs = (
+            ("الله", "اللاه"),
+            ("اللّه", "الله"),
+            ("إلَّا", "إِلّا"),
+            ("نْ ال", "نَ ال"),
+            ("لْ ال", "لِ ال"),
+            ("إلَى", "إِلَى"),
+            ("إذَا", "إِذَا"),
+            ("ك ", "كَ "),
+            (" ال ", " الْ "),
+            ("ْ ال", "ِ ال"),
+            ("عَمْرٍو", "عَمْرٍ"),
+            ("عَمْرُو", "عَمْرُ"),
+        )
+        # Matches if any of the substitutions above can fire; most baits contain none
+        self._re_common_subs_any = re.compile("|".join(re.escape(old) for old, _ in self._common_subs))
+        # Alif following tanween, plus one trailing diacritic if any. The lookbehind
+        # checks the original text, so "ًاًا" loses both Alifs.
+        self._re_tnween_alif = re.compile(f"(?<=[{cc_tnween}])ا[{cc_all_tashkeel}]?")
+        # Space-delimited word (same boundaries as bait.split(" "))
+        self._re_word = re.compile("[^ ]+")
+        # Translation table for stripping diacritics (except Shadda) from words
+        self._strip_no_shadda = str.maketrans("", "", cc_removable)
+        # Run of consecutive harakat; only the last one is kept
+        self._re_dup_harakat = re.compile(f"[{cc_harakat}]+([{cc_harakat}])")
+
+        self._rebuild_change_index()
+
+        # LRU cache of per-word CHANGE_LST transformations (cleared when the list changes)
+        self._word_cache = OrderedDict()
+        self._word_cache_size = 4096
+        # LRU cache of full prepare_text results keyed by (text, saturate, muqayyad)
+        self._prepare_cache = OrderedDict()
+        self._prepare_cache_size = 4096
 
     def register_custom_spelling(self, word, replacement):
         """
@@ -76,62 +250,45 @@ class ArudiConverter:
         """
         self.CHANGE_LST[word] = replacement
 
-    def _normalize_shadda(self, text):
-        # Ensure Shadda comes before Harakat/Tanween
-        harakat_all = "".join(self.harakat + self.tnween_chars)
-        shadda = "".join(self.shadda_chars)
-        return re.sub(f"([{harakat_all}])([{shadda}])", r"\2\1", text)
-
-    def _normalize_orthography(self, text):
-        # Normalize Dagger Alif (Superscript Alif) to standard Alif
-        text = text.replace("\u0670", ALEF)
-        
-        # Remove Harakat from standard Alif (ALEF cannot carry vowel unless it's Hamza)
-        # This fixes cases where text has L+A+Fatha (treated as L+A(mover))
-        harakat_pattern = f"[{FATHA}{DAMMA}{KASRA}]"
-        text = re.sub(f"{ALEF}{harakat_pattern}", ALEF, text)
-        
-        # Normalize Alif + Tanween Fath -> Tanween Fath + Alif
-        # (Ensures consistent processing order)
-        text = re.sub(f"{ALEF}{FATHATAN}", f"{FATHATAN}{ALEF}", text)
-        
-        return text
-
-    def _normalize_ligatures(self, text):
-        # Decompose Lam-Alif ligatures with potential diacritics
-        # Matches Ligature + Optional Haraka
-        # Replaces with Lam + Optional Haraka + Second Letter
-        
-        harakat_pattern = f"[{''.join(self.harakat + self.tnween_chars)}]"
-        
-        def replace_la(match):
-            # match.group(0) is the ligature + optional haraka
-            # We want L + haraka (if any) + A
-            s = match.group(0)
-            haraka = s[1:] if len(s) > 1 else ""
-            return "ل" + haraka + "ا"
-
-        def replace_la_hamza_above(match):
-            s = match.group(0)
-            haraka = s[1:] if len(s) > 1 else ""
-            return "ل" + haraka + "أ"
-
-        def replace_la_hamza_below(match):
-            s = match.group(0)
-            haraka = s[1:] if len(s) > 1 else ""
-            return "ل" + haraka + "إ"
-
-        def replace_la_madda(match):
-            s = match.group(0)
-            haraka = s[1:] if len(s) > 1 else ""
-            return "ل" + haraka + "آ"
-
-        text = re.sub(f"ﻻ({harakat_pattern})?", replace_la, text)
-        text = re.sub(f"ﻷ({harakat_pattern})?", replace_la_hamza_above, text)
-        text = re.sub(f"ﻹ({harakat_pattern})?", replace_la_hamza_below, text)
-        text = re.sub(f"ﻵ({harakat_pattern})?", replace_la_madda, text)
-        
-        return text
+    def _change_lst_changed(self):
+        self._rebuild_change_index()
+        self._word_cache.clear()
+        self._prepare_cache.clear()
+
+    def _rebuild_change_index(self):
+        # Every valid prefix + CHANGE_LST key, mapped to its vocalized replacement. When
+        # several splits give the same word, the key listed first in CHANGE_LST wins.
+        self._prefixed_change = {}
+        for key, replacement in self.CHANGE_LST.items():
+            if key:
+                for prefix, vocalized in self._vocalized_prefixes.items():
+                    self._prefixed_change.setdefault(prefix + key, vocalized + replacement)
+
+    def _normalize(self, text):
+        """
+        Normalizes orthography, ligatures and Shadda order in one regex pass.
+        1. Dagger Alif (Superscript Alif) -> standard Alif.
+        2. Alif + Haraka -> Alif (ALEF cannot carry vowel unless it's Hamza).
+        3. Alif + (dropped Haraka) + Tanween Fath -> Tanween Fath + Alif (ensures consistent processing order).
+        4. Lam-Alif ligature + optional Haraka -> Lam + Haraka + second letter.
+        5. Haraka/Tanween + Shadda -> Shadda + Haraka/Tanween.
+        """
+        return self._re_normalize.sub(self._normalize_match, text)
+
+    def _normalize_match(self, match):
+        ligature = match.group("ligature")
+        if ligature:
+            if match.group("ligature_tanween"):
+                # Alif + Tanween Fath right after the ligature is reordered before decomposing
+                return "ل" + FATHATAN + self._lig_map[ligature] + ALEF
+            return "ل" + (match.group("ligature_haraka") or "") + self._lig_map[ligature]
+        if match.group("alef_tanween"):
+            return FATHATAN + ALEF
+        if match.group("alef_haraka"):
+            return ALEF
+        if match.group("shadda"):
+            return match.group("shadda") + match.group("haraka")
+        return ALEF  # Dagger Alif
 
     def _resolve_wasl(self, text):
         """
@@ -143,40 +300,69 @@ class ArudiConverter:
         # The original regex was flawed because it did not capture the diacritic.
         # This version captures the letter and its optional diacritic, preserving it.
         # Using S* to handle multiple diacritics (e.g., shadda + fatha).
-        text = re.sub(r"([^\s]\S*)([اىيو])\s+ا", r"\1", text)
+        text = self._re_wasl_longvowel.sub(r"\1", text)
         
         # Pattern: Space + Alif (Wasl) -> Drop both
         # Matches any word starting with bare Alif preceded by space.
-        text = re.sub(r"\s+ا", "", text)
+        text = self._re_wasl_space_alif.sub("", text)
 
         # 3. Drop Alif of "Allah" if prefixed by Fa/Wa/Ba/Ta/Kaf
         # Pattern: (Prefix)(Vowel?)Alif(LamLam) -> (Prefix)(Vowel?)LamLam
-        prefixes = "\u0641\u0648\u0628\u062a\u0643"
-        harakat = "".join(self.harakat)
-        text = re.sub(f"([{prefixes}])([{harakat}]?)ا(لل)", r"\1\2\3", text)
+        text = self._re_allah_prefix.sub(r"\1\2\3", text)
 
         return text
 
     def _handle_space(self, plain_chars):
+        # Drop the last character (and a separating space before it) in place
         if not plain_chars:
-            return plain_chars
+            return
 
         if plain_chars[-1] == " ":
-            return plain_chars[:-2]
+            del plain_chars[-2:]
         else:
-            return plain_chars[:-1]
+            del plain_chars[-1]
 
     def _remove_extra_harakat(self, text):
-        out = ""
-        i = 0
-        while i < len(text):
-            if i < len(text) - 1:
-                if text[i] in self.harakat and text[i + 1] in self.harakat:
-                    i += 1
-                    continue
-            out += text[i]
-            i += 1
-        return out
+        return self._re_dup_harakat.sub(r"\1", text)
+
+    def _transform_word_match(self, match):
+        return self._transform_word(match.group(0))
+
+    def _transform_word(self, word):
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            self._word_cache.move_to_end(word)
+            return cached
+
+        result = self._transform_word_uncached(word)
+        self._word_cache[word] = result
+        if len(self._word_cache) > self._word_cache_size:
+            self._word_cache.popitem(last=False)
+        return result
+
+    def _transform_word_uncached(self, word):
+        # Diacritics are stripped once; CHANGE_LST keys are stored undiacritized, so a
+        # Shadda-free word needs a single lookup. Words carrying Shadda are tried with
+        # it preserved first (e.g. for 'لكنّ'), then with it removed.
+        cleaned_with_shadda = word.translate(self._strip_no_shadda)
+        if SHADDA in cleaned_with_shadda:
+            candidates = (cleaned_with_shadda, cleaned_with_shadda.replace(SHADDA, ""))
+        else:
+            candidates = (cleaned_with_shadda,)
+
+        # Check Exact Match (Shadda first, then Plain)
+        for candidate in candidates:
+            replacement = self.CHANGE_LST.get(candidate)
+            if replacement is not None:
+                return replacement
+
+        # Prefix check (e.g. 'ولكن')
+        for candidate in candidates:
+            replacement = self._prefixed_change.get(candidate)
+            if replacement is not None:
+                return replacement
+
+        return word
 
     def _process_specials_before(self, bait):
         # Handle specific starting Alif cases
@@ -188,12 +374,11 @@ class ArudiConverter:
 
         # Detach prefixes to handle Al- logic (WaAl -> Wa Al)
         # Matches: Fa, Waw, Ba, Ta, Kaf followed by Al, at start of word
-        bait = re.sub(r"(^|\s)([فوبتك])([َُِ])?ال", r"\1\2\3 ال", bait)
+        bait = self._re_prefix_al.sub(r"\1\2\3 ال", bait)
 
         # Solar Lam Handling: Al + Sun Letter -> A + Sun Letter
         # Drops the Lam which is silent in Solar cases
-        sun_letters = "تثدذرزسشصضطظلن"
-        bait = re.sub(f" ال([{sun_letters}])", r" ا\1", bait)
+        bait = self._re_sun.sub(r" ا\1", bait)
 
         bait = bait.replace("وا ", "و ")
         if bait.endswith("وا"):
@@ -203,91 +388,20 @@ class ArudiConverter:
         if bait.endswith("وْا"):
             bait = bait[:-2] + "و"
 
-        # Common substitutions
-        bait = bait.replace("الله", "اللاه")
-        bait = bait.replace("اللّه", "الله")
-        bait = bait.replace("إلَّا", "إِلّا")
-        bait = bait.replace("نْ ال", "نَ ال")
-        bait = bait.replace("لْ ال", "لِ ال")
-        bait = bait.replace("إلَى", "إِلَى")
-        bait = bait.replace("إذَا", "إِذَا")
-        bait = bait.replace("ك ", "كَ ")
-        bait = bait.replace(" ال ", " الْ ")
-        bait = bait.replace("ْ ال", "ِ ال")
-        bait = bait.replace("عَمْرٍو", "عَمْرٍ")
-        bait = bait.replace("عَمْرُو", "عَمْرُ")
-
-        # Word replacements from CHANGE_LST
-        out = []
-        valid_prefixes = ["و", "ف", "ك", "ب", "ل", "وب", "فك", "ول", "فل"]
-        
-        # Prepare regex for stripping harakat but keeping shadda
-        # Exclude SHADDA from removal list
-        removable_chars = self.harakat + self.sukun + self.tnween_chars
-        strip_harakat_pattern = f"[{''.join(removable_chars)}]"
-
-        for word in bait.split(" "):
-            # 1. Try match with Shadda preserved (e.g. for 'لكنّ')
-            cleaned_with_shadda = re.sub(strip_harakat_pattern, "", word)
-            # 2. Try match with Shadda removed (standard)
-            cleaned_plain = strip_tashkeel(word)
-            
-            found = False
-            
-            # Check Exact Match (Shadda first, then Plain)
-            for candidate in [cleaned_with_shadda, cleaned_plain]:
-                if candidate in self.CHANGE_LST:
-                    out.append(self.CHANGE_LST[candidate])
-                    found = True
-                    break
-            if found: 
-                continue
-
-            # Prefix check
-            # We iterate candidates again to check prefixes
-            for candidate in [cleaned_with_shadda, cleaned_plain]:
-                if found:
-                    break
-                for key, replacement in self.CHANGE_LST.items():
-                    if candidate.endswith(key):
-                        prefix = candidate[:-len(key)]
-                        if prefix in valid_prefixes:
-                            prefix_harakat = {
-                                "و": "وَ", "ف": "فَ", "ك": "كَ", "ب": "بِ", "ل": "لِ"
-                            }
-                            
-                            # Construct new word
-                            new_prefix = ""
-                            for p_char in prefix:
-                                new_prefix += prefix_harakat.get(p_char, p_char) 
-                                
-                            out.append(new_prefix + replacement)
-                            found = True
-                            break
-            
-            if not found:
-                out.append(word)
-
-        bait = " ".join(out)
+        # Common substitutions (applied in order; later rules see earlier results)
+        if self._re_common_subs_any.search(bait):
+            for old, new in self._common_subs:
+                bait = bait.replace(old, new)
+
+        # Word replacements from CHANGE_LST (memoized per word)
+        bait = self._re_word.sub(self._transform_word_match, bait)
 
         # Ensure second char isn't a bare letter if first is
-        if len(bait) > 1 and bait[1] in self.all_chars:
+        if len(bait) > 1 and bait[1] in self._all_chars_set:
             bait = bait[0] + self.harakat[1] + bait[1:]
 
         # Filter trailing alif after tanween
-        final_chars = []
-        i = 0
-        while i < len(bait):
-            if bait[i] == "ا" and i > 0 and bait[i - 1] in self.tnween_chars:
-                i += 1
-                # skip following harakat if any
-                if i < len(bait) and bait[i] in self.harakat + self.sukun + self.tnween_chars + self.shadda_chars:
-                    i += 1
-                continue
-            final_chars.append(bait[i])
-            i += 1
-
-        return "".join(final_chars)
+        return self._re_tnween_alif.sub("", bait)
 
     def _process_specials_after(self, bait):
         bait = bait.replace("ةن", "تن")
@@ -299,135 +413,143 @@ class ArudiConverter:
         Based on Bohour's extract_tf3eelav3.
         """
         text = self._remove_extra_harakat(text)
-        chars = list(text.replace(ALEF_MADDA, "ءَا").strip())  # Replace Madda
-        chars = [c for c in chars if c in self.prem_chars]
-        chars = list(re.sub(" +", " ", "".join(chars).strip()))
+        text = text.translate(self._keep_prem)  # Expand Madda, drop characters outside prem_chars
+        # Space is the only whitespace left, so split/join trims and collapses runs of it
+        chars = " ".join(text.split())  # indexed directly as a str
         
         # DEBUG
         # print(f"Trace: {chars}")
         
-        out_pattern = ""
-        plain_chars = ""
+        # List accumulators (one character per element) joined once at the end
+        out_pattern = []
+        plain_chars = []
+
+        # Loop invariants hoisted out of the per-character state machine
+        n = len(chars)
+        kasra, damma = self.harakat[0], self.harakat[2]
 
         i = 0
-        while i < len(chars) - 1:
+        while i < n - 1:
             char = chars[i]
             next_char = chars[i + 1]
             # print(f"i={i}, char={char}, next={next_char}")
 
-            if char in self.all_chars:
+            if char in self._all_chars_set:
                 if char == " ":
-                    plain_chars += char
+                    plain_chars.append(char)
                     i += 1
                     continue
 
                 # Lookahead
-                if next_char == " " and i + 2 < len(chars):
+                if next_char == " " and i + 2 < n:
                     next_char = chars[i + 2]
 
                 next_next_char = None
-                if i < len(chars) - 2:
+                if i < n - 2:
                     next_next_char = chars[i + 2]
 
-                prev_digit = out_pattern[-1] if len(out_pattern) > 0 else ""
+                prev_digit = out_pattern[-1] if out_pattern else ""
 
                 # Logic
-                if next_char in self.harakat:
+                if next_char in self._harakat_set:
                     # Check for Muqayyad (Restricted Rhyme) at the very end
                     # If we are at the last character group (char + haraka is end of string)
-                    is_last_group = (i + 2 >= len(chars))
+                    is_last_group = (i + 2 >= n)
                     # Or if followed by space then end? (Arudi usually strips trailing spaces but let's be safe)
                     
                     if muqayyad and is_last_group:
                         # Treat as Sakin (drop vowel)
                         if prev_digit != "0":
-                            out_pattern += "0"
-                            plain_chars += char
+                            out_pattern.append("0")
+                            plain_chars.append(char)
                         else:
                             # If prev was Sakin, we have Iltiqa Sakinayn at end.
                             # In Muqayyad rhyme, this is allowed (e.g. 'Mard').
                             # But typically we avoid 00. 
                             # Standard Arudi: 00 is allowed at end (Waqf).
-                            out_pattern += "0"
-                            plain_chars += char
+                            out_pattern.append("0")
+                            plain_chars.append(char)
                         # Skip the haraka
                     else:
-                        out_pattern += "1"
-                        plain_chars += char
+                        out_pattern.append("1")
+                        plain_chars.append(char)
 
-                elif next_char in self.sukun:
+                elif next_char in self._sukun_set:
                     if prev_digit != "0":
-                        out_pattern += "0"
-                        plain_chars += char
-                    elif (i + 1) == len(chars) - 1:
+                        out_pattern.append("0")
+                        plain_chars.append(char)
+                    elif (i + 1) == n - 1:
                         # End of line sukun handling: Allow consecutive Sukun (00)
-                        out_pattern += "0"
-                        plain_chars += char
+                        out_pattern.append("0")
+                        plain_chars.append(char)
                     else:
-                        plain_chars = self._handle_space(plain_chars) + char
+                        self._handle_space(plain_chars)
+                        plain_chars.append(char)
 
-                elif next_char in self.tnween_chars:
+                elif next_char in self._tnween_set:
                     if char != "ا":
-                        plain_chars += char
-                    plain_chars += "ن"
-                    out_pattern += "10"
+                        plain_chars.append(char)
+                    plain_chars.append("ن")
+                    out_pattern.extend("10")
 
                     # Skip trailing Alif (Tanween Fath)
-                    if i + 2 < len(chars) and chars[i + 2] == "ا":
+                    if i + 2 < n and chars[i + 2] == "ا":
                         i += 1
 
-                elif next_char in self.shadda_chars:
+                elif next_char in self._shadda_set:
                     if prev_digit != "0":
-                        plain_chars += char + char
-                        out_pattern += "01"
+                        plain_chars.extend((char, char))
+                        out_pattern.extend("01")
                     else:
-                        plain_chars = self._handle_space(plain_chars) + char + char
-                        out_pattern += "1"
+                        self._handle_space(plain_chars)
+                        plain_chars.extend((char, char))
+                        out_pattern.append("1")
 
                     # Check what follows Shadda
-                    if i + 2 < len(chars):
-                        if chars[i + 2] in self.harakat:
+                    if i + 2 < n:
+                        if chars[i + 2] in self._harakat_set:
                             # Check Muqayyad for Shadda+Harakah at end?
                             # Example: "Radd" (R + Shadda).
                             # If "Raddu" -> R(0) R(1).
                             # If Muqayyad "Radd" -> R(0) R(0).
-                            is_last_shadda_group = (i + 3 >= len(chars))
+                            is_last_shadda_group = (i + 3 >= n)
                             if muqayyad and is_last_shadda_group:
                                 # We already added '01' or '1'. The '1' corresponds to the second letter being Mover.
                                 # If Muqayyad, the second letter should be Sakin.
                                 # So '01' -> '00'. '1' -> '0'.
                                 # We need to fix the last digit added.
-                                out_pattern = out_pattern[:-1] + "0"
+                                out_pattern[-1] = "0"
                                 # Skip the harakah
                                 i += 1
                             else:
                                 i += 1  # Skip harakat processing next loop
-                        elif chars[i + 2] in self.tnween_chars:
+                        elif chars[i + 2] in self._tnween_set:
                             i += 1
-                            plain_chars += "ن"
-                            out_pattern += "0"
+                            plain_chars.append("ن")
+                            out_pattern.append("0")
 
                             # Skip trailing Alif (Shadda + Tanween Fath)
-                            if i + 2 < len(chars) and chars[i + 2] == "ا":
+                            if i + 2 < n and chars[i + 2] == "ا":
                                 i += 1
 
-                elif next_char in [ALEF, ALEF_MAKSURA]:
-                    out_pattern += "10"
-                    plain_chars += char + next_char
+                elif next_char in self._alef_like_set:
+                    out_pattern.extend("10")
+                    plain_chars.extend((char, next_char))
 
-                elif next_char in self.all_chars:
+                elif next_char in self._all_chars_set:
                     # Letter followed by Letter (implies first is Sakin if no haraka in betweeen?)
                     # Or assumes implicit sukun?
                     if prev_digit != "0":
-                        out_pattern += "0"
-                        plain_chars += char
-                    elif prev_digit == "0" and i + 1 < len(chars) and chars[i + 1] == " ":
+                        out_pattern.append("0")
+                        plain_chars.append(char)
+                    elif prev_digit == "0" and i + 1 < n and chars[i + 1] == " ":
                         # Special case from Bohour
-                        out_pattern += "1"
-                        plain_chars += char
+                        out_pattern.append("1")
+                        plain_chars.append(char)
                     else:
-                        plain_chars = self._handle_space(plain_chars) + char
-                        out_pattern += "0"
+                        self._handle_space(plain_chars)
+                        plain_chars.append(char)
+                        out_pattern.append("0")
                     i -= 1  # Backtrack? This logic in Bohour is tricky.
                     # If we assumed it was a letter but it's followed by a letter, we treat current as sakin.
                     # The i -= 1 might be to re-process? No, i += 2 at end.
@@ -437,18 +559,18 @@ class ArudiConverter:
                 # And NOT muqayyad (if muqayyad, we don't saturate)
                 if not muqayyad and next_next_char == " " and prev_digit != "0":
                     if char == "ه":
-                        if next_char == self.harakat[0]:  # Kasra
-                            plain_chars += "ي"
-                            out_pattern += "0"
-                        if next_char == self.harakat[2]:  # Damma
-                            plain_chars += "و"
-                            out_pattern += "0"
+                        if next_char == kasra:
+                            plain_chars.append("ي")
+                            out_pattern.append("0")
+                        if next_char == damma:
+                            plain_chars.append("و")
+                            out_pattern.append("0")
 
                 i += 2  # Advance past char and its diacritic/follower
             elif char == "ا":
                 # Alef encountered as 'char' (e.g. after a diacritic consumed the previous letter)
-                out_pattern += "0"
-                plain_chars += char
+                out_pattern.append("0")
+                plain_chars.append(char)
                 i += 1
             else:
                 i += 1
@@ -458,26 +580,20 @@ class ArudiConverter:
         # If Not Muqayyad, we saturate.
         
         if not muqayyad and saturate and out_pattern and out_pattern[-1] != "0":
-            out_pattern += "0"  # Always end with sukun (Qafiyah)
+            out_pattern.append("0")  # Always end with sukun (Qafiyah)
 
         # Ashba' (Saturation) of last letter
         # Only if not muqayyad
         if not muqayyad and saturate and chars:
             last_char = chars[-1]
-            if last_char == self.harakat[0]:  # Kasra
-                plain_chars += "ي"
-            elif last_char == self.tnween_chars[1]:  # Kasr Tanween
-                plain_chars = plain_chars[:-1] + "ي"
-            elif last_char == self.harakat[1]:  # Fatha
-                plain_chars += "ا"
-            elif last_char == self.harakat[2]:  # Damma
-                plain_chars += "و"
-            elif last_char == self.tnween_chars[0]:  # Damm Tanween
-                plain_chars = plain_chars[:-1] + "و"
-            elif last_char in self.mostly_saken and len(chars) > 1 and chars[-2] not in self.tnween_chars:
-                plain_chars += last_char
-
-        return plain_chars, out_pattern
+            if last_char in self._ashba_append:  # Kasra, Fatha, Damma
+                plain_chars.append(self._ashba_append[last_char])
+            elif last_char in self._ashba_replace_last:  # Kasr/Damm Tanween
+                plain_chars[-1:] = [self._ashba_replace_last[last_char]]
+            elif last_char in self._mostly_saken_set and n > 1 and chars[-2] not in self._tnween_set:
+                plain_chars.append(last_char)
+
+        return "".join(plain_chars), "".join(out_pattern)
 
     def prepare_text(self, text, saturate=True, muqayyad=False):
         """
@@ -487,11 +603,14 @@ class ArudiConverter:
         if not text:
             return "", ""
 
+        key = (text, saturate, muqayyad)
+        cached = self._prepare_cache.get(key)
+        if cached is not None:
+            self._prepare_cache.move_to_end(key)
+            return cached
+
         # print(f"Original: {text}")
-        text = self._normalize_orthography(text)
-        # print(f"Norm Ortho: {text}")
-        text = self._normalize_ligatures(text)
-        text = self._normalize_shadda(text)
+        text = self._normalize(text)
         preprocessed = self._process_specials_before(text)
         # print(f"Specials Before: {preprocessed}")
         preprocessed = self._resolve_wasl(preprocessed)
@@ -499,4 +618,32 @@ class ArudiConverter:
         arudi_style, pattern = self._extract_pattern(preprocessed, saturate=saturate, muqayyad=muqayyad)
         arudi_style = self._process_specials_after(arudi_style)
 
+        self._prepare_cache[key] = (arudi_style, pattern)
+        if len(self._prepare_cache) > self._prepare_cache_size:
+            self._prepare_cache.popitem(last=False)
         return arudi_style, pattern
+
+    def prepare_texts(self, texts, saturate=True, muqayyad=False, workers=1):
+        """
+        Converts a batch of texts, equivalent to calling `prepare_text` on each.
+
+        Args:
+            texts (Iterable[str]): The texts (e.g. all hemistichs of a diwan) to convert.
+            saturate (bool): Passed to `prepare_text`. Defaults to True.
+            muqayyad (bool): Passed to `prepare_text`. Defaults to False.
+            workers (int): Number of worker processes. With more than one, the converter
+                (including custom spellings) is sent once to each process. Defaults to 1.
+
+        Returns:
+            list[tuple[str, str]]: The `(arudi_style, pattern)` pair of each text, in order.
+        """
+        prepare = partial(self.prepare_text, saturate=saturate, muqayyad=muqayyad)
+        if workers <= 1:
+            return list(map(prepare, texts))
+
+        texts = list(texts)
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+            return list(
+                pool.map(partial(_prepare_in_worker, saturate=saturate, muqayyad=muqayyad), texts, chunksize=chunksize)
+            )
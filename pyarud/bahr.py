@@ -1,4 +1,7 @@
+import functools
 import itertools
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from .tafeela import (
     Fae_laton,
@@ -54,6 +57,17 @@ from .zihaf import (
 )
 
 
+def _copy_pattern_rows(rows):
+    # Rows hold strings plus the "feet" / "allowed_arudhs" lists
+    return [{key: value[:] if isinstance(value, list) else value for key, value in row.items()} for row in rows]
+
+
+@functools.cache
+def _tafeela_forms(tafeela_class):
+    # All zehaf forms of a tafeela depend only on its class; shared by every meter
+    return tuple(tafeela_class().all_zehaf_tafeela_forms())
+
+
 class Bahr:
     """
     Base class for defining poetic meters (Buhur).
@@ -67,16 +81,26 @@ class Bahr:
     only_one_shatr = False
     disallowed_zehafs_for_hashw: dict[int, tuple[list[type[BaseEllahZehaf]], ...]] = {}
 
-    @property
+    # Generated patterns depend only on the (class-level) definition, so they are
+    # computed once per meter class. Public accessors hand out copies; internal
+    # readers (sub-bahr merging, ArudhProcessor) use the shared tables directly.
+    _patterns_cache: ClassVar[dict[type["Bahr"], dict[str, Any]]] = {}
+    _allowed_feet_cache: ClassVar[dict[tuple[type["Bahr"], int], list[list[str]]]] = {}
+    _bait_cache: ClassVar[dict[type["Bahr"], list[str]]] = {}
+
+    @functools.cached_property
     def last_tafeela(self):
         return self.tafeelat[-1]()
 
     def get_shatr_hashw_combinations(self, shatr_index=0):
+        """
+        Returns, for each Hashw position, the allowed Tafeela forms.
+        The forms are clones of per-class cached instances, so callers may modify them.
+        """
         combinations = []
         # Hashw is everything except the last tafeela (Arudh/Dharb)
         for i, tafeela_class in enumerate(self.tafeelat[:-1]):
-            tafeela = tafeela_class()
-            forms = tafeela.all_zehaf_tafeela_forms()
+            forms = [f.clone() for f in _tafeela_forms(tafeela_class)]
 
             # Filter disallowed zehafs
             if shatr_index in self.disallowed_zehafs_for_hashw:
@@ -91,7 +115,19 @@ class Bahr:
         """
         Returns a list of lists, where index i contains all valid binary strings for foot i.
         Used for granular analysis to align input to valid feet.
+        Each call returns a fresh copy of the per-class cached result.
         """
+        return [list(forms) for forms in self._shared_allowed_feet_patterns(shatr_index)]
+
+    def _shared_allowed_feet_patterns(self, shatr_index=0):
+        # Shared per-class result, must not be mutated
+        key = (type(self), shatr_index)
+        cached = Bahr._allowed_feet_cache.get(key)
+        if cached is None:
+            cached = Bahr._allowed_feet_cache[key] = self._build_allowed_feet_patterns(shatr_index)
+        return cached
+
+    def _build_allowed_feet_patterns(self, shatr_index):
         allowed_per_index = []
 
         # Hashw feet
@@ -100,44 +136,64 @@ class Bahr:
             allowed_per_index.append([str(f) for f in forms])
 
         # Last foot (Arudh/Dharb)
+        ending_feet = self._ending_feet()
+        if self.only_one_shatr or shatr_index == 0:
+            # Sadr -> Arudh (single shatr endings are treated as Arudh)
+            ending_classes = list(self.arod_dharbs_map)
+        else:  # Ajuz -> Dharb
+            ending_classes = [z_cls for d_list in self.arod_dharbs_map.values() for z_cls in d_list]
+
         last_feet = set()
-        if self.only_one_shatr:
-            # Treat endings as Arudh
-            if isinstance(self.arod_dharbs_map, set):
-                for z_cls in self.arod_dharbs_map:
-                    try:
-                        last_feet.add(str(z_cls(self.last_tafeela).modified_tafeela))
-                    except AssertionError:
-                        continue
-            else:
-                for z_cls in self.arod_dharbs_map:
-                    try:
-                        last_feet.add(str(z_cls(self.last_tafeela).modified_tafeela))
-                    except AssertionError:
-                        continue
-        else:
-            if shatr_index == 0:  # Sadr -> Arudh
-                for z_cls in self.arod_dharbs_map.keys():
-                    try:
-                        last_feet.add(str(z_cls(self.last_tafeela).modified_tafeela))
-                    except AssertionError:
-                        continue
-            else:  # Ajuz -> Dharb
-                for d_list in self.arod_dharbs_map.values():
-                    for z_cls in d_list:
-                        try:
-                            last_feet.add(str(z_cls(self.last_tafeela).modified_tafeela))
-                        except AssertionError:
-                            continue
+        for z_cls in ending_classes:
+            if ending_feet[z_cls] is not None:
+                last_feet.add(ending_feet[z_cls])
 
         allowed_per_index.append(list(last_feet))
         return allowed_per_index
 
+    def _ending_feet(self):
+        """
+        Maps every Arudh/Dharb class used by this meter to the binary string of the
+        resulting last foot, or None if it cannot apply. Each class is applied once.
+        """
+        # Iterating either shape of arod_dharbs_map yields the Arudh classes
+        classes = list(self.arod_dharbs_map)
+        if isinstance(self.arod_dharbs_map, dict):
+            classes += [z_cls for d_list in self.arod_dharbs_map.values() for z_cls in d_list]
+
+        # Zehafs clone their input, so one instance serves every class
+        last_tafeela = self.last_tafeela
+        feet: dict[type[BaseEllahZehaf], str | None] = {}
+        for z_cls in classes:
+            if z_cls in feet:
+                continue
+            try:
+                feet[z_cls] = str(z_cls(last_tafeela).modified_tafeela)
+            except AssertionError:
+                feet[z_cls] = None
+        return feet
+
     @property
     def detailed_patterns(self):
         """
         Returns structured patterns for Sadr and Ajuz separately.
+        Each call returns a fresh copy of the per-class cached result.
         """
+        shared = self._shared_detailed_patterns()
+        return {
+            "sadr": _copy_pattern_rows(shared["sadr"]),
+            "ajuz": _copy_pattern_rows(shared["ajuz"]),
+            "pairs": set(shared["pairs"]),
+        }
+
+    def _shared_detailed_patterns(self):
+        # Shared per-class result, must not be mutated
+        cached = Bahr._patterns_cache.get(type(self))
+        if cached is None:
+            cached = Bahr._patterns_cache[type(self)] = self._build_detailed_patterns()
+        return cached
+
+    def _build_detailed_patterns(self):
         patterns = {
             "sadr": [],
             "ajuz": [],
@@ -147,34 +203,16 @@ class Bahr:
         if self.only_one_shatr:
              # Single shatr meters (Mashtoor/Manhook)
              # We treat them as Sadr only
-             hashw = self.get_shatr_hashw_combinations()
+             # Feet as binary strings, converted once rather than per permutation
+             hashw = [[str(f) for f in forms] for forms in self.get_shatr_hashw_combinations()]
              
              # For single shatr, the "Arudh" is the end of the line
-             
-             # Collect all allowed endings from the map
-             # In single shatr, arod_dharbs_map is a set or dict. 
-             # If dict, keys are allowed endings? Or values?
-             # Looking at subclasses: arod_dharbs_map = {Waqf, Kasf} (Set)
-             
-             endings = []
-             if isinstance(self.arod_dharbs_map, set):
-                 for z_cls in self.arod_dharbs_map:
-                     try:
-                         endings.append(z_cls(self.last_tafeela).modified_tafeela)
-                     except AssertionError:
-                         continue
-             else:
-                 # If it's a dict (some Mashtoors might use dict?), iterate keys
-                 for z_cls in self.arod_dharbs_map:
-                     try:
-                         endings.append(z_cls(self.last_tafeela).modified_tafeela)
-                     except AssertionError:
-                         continue
+             ending_feet = self._ending_feet()
+             endings = [ending_feet[z_cls] for z_cls in self.arod_dharbs_map if ending_feet[z_cls] is not None]
             
-             permutations = list(itertools.product(*hashw, endings))
-             for p in permutations:
-                 # p is a tuple of Tafeela objects
-                 feet_strs = [str(t) for t in p]
+             for p in itertools.product(*hashw, endings):
+                 # p is a tuple of foot strings
+                 feet_strs = list(p)
                  full_str = "".join(feet_strs)
                  patterns["sadr"].append({
                      "pattern": full_str,
@@ -186,23 +224,24 @@ class Bahr:
 
         else:
             # Two shatrs
-            sadr_hashw = self.get_shatr_hashw_combinations(0)
-            ajuz_hashw = self.get_shatr_hashw_combinations(1)
+            # Feet as binary strings, converted once rather than per permutation
+            sadr_hashw = [[str(f) for f in forms] for forms in self.get_shatr_hashw_combinations(0)]
+            ajuz_hashw = [[str(f) for f in forms] for forms in self.get_shatr_hashw_combinations(1)]
+
+            ending_feet = self._ending_feet()
 
             for arudh_z_cls, dharb_z_list in self.arod_dharbs_map.items():
                 # 1. Generate Arudh (End of Sadr)
-                try:
-                    arudh_obj = arudh_z_cls(self.last_tafeela).modified_tafeela
-                except AssertionError:
+                arudh_str = ending_feet[arudh_z_cls]
+                if arudh_str is None:
                     continue
-                
-                arudh_str = str(arudh_obj)
+
+                # dharb_z_list is tuple of allowed classes for this Arudh
+                compatible_dharbs = [ending_feet[d_z] for d_z in dharb_z_list if ending_feet[d_z] is not None]
 
                 # 2. Generate Sadr variations for this Arudh
-                sadr_perms = list(itertools.product(*sadr_hashw, [arudh_obj]))
-                
-                for sp in sadr_perms:
-                    feet_strs = [str(t) for t in sp]
+                for sp in itertools.product(*sadr_hashw, [arudh_str]):
+                    feet_strs = list(sp)
                     full_sadr = "".join(feet_strs)
                     
                     patterns["sadr"].append({
@@ -212,24 +251,13 @@ class Bahr:
                         "arudh_class": arudh_z_cls.__name__
                     })
 
-                    # 3. Generate compatible Dharbs (End of Ajuz)
-                    # dharb_z_list is tuple of allowed classes for this Arudh
-                    compatible_dharbs = []
-                    for d_z in dharb_z_list:
-                        try:
-                            dharb_obj = d_z(self.last_tafeela).modified_tafeela
-                            compatible_dharbs.append(dharb_obj)
-                        except AssertionError:
-                            continue
-                    
+                    # 3. Compatible Dharbs (End of Ajuz) were resolved above
                     if not compatible_dharbs:
                         continue
 
                     # 4. Generate Ajuz variations for these Dharbs
-                    ajuz_perms = list(itertools.product(*ajuz_hashw, compatible_dharbs))
-                    
-                    for ap in ajuz_perms:
-                        feet_strs_a = [str(t) for t in ap]
+                    for ap in itertools.product(*ajuz_hashw, compatible_dharbs):
+                        feet_strs_a = list(ap)
                         full_ajuz = "".join(feet_strs_a)
                         
                         patterns["ajuz"].append({
@@ -248,7 +276,7 @@ class Bahr:
         
         # Add sub-bahrs
         for sub in self.sub_bahrs:
-            sub_p = sub().detailed_patterns
+            sub_p = sub()._shared_detailed_patterns()
             patterns["sadr"].extend(sub_p["sadr"])
             patterns["ajuz"].extend(sub_p["ajuz"])
             patterns["pairs"].update(sub_p["pairs"])
@@ -259,12 +287,16 @@ class Bahr:
     def bait_combinations(self):
         # Deprecated wrapper for backward compatibility
         # Returns flattened list of full lines
-        p = self.detailed_patterns
-        if self.only_one_shatr:
-            return sorted(list(set(x["pattern"] for x in p["sadr"])), key=len)
-        
-        # Reconstruct full lines from pairs
-        return sorted([s+a for s,a in p["pairs"]], key=len)
+        cached = Bahr._bait_cache.get(type(self))
+        if cached is None:
+            p = self._shared_detailed_patterns()
+            if self.only_one_shatr:
+                cached = sorted(list(set(x["pattern"] for x in p["sadr"])), key=len)
+            else:
+                # Reconstruct full lines from pairs
+                cached = sorted([s+a for s,a in p["pairs"]], key=len)
+            Bahr._bait_cache[type(self)] = cached
+        return list(cached)
 
 
 # --- Sub-Bahrs Definitions ---
@@ -545,22 +577,26 @@ class Mutadarak(Bahr):
     sub_bahrs = (MutadarakMajzoo, MutadarakMashtoor)
 
 
+_ALL_METERS: MappingProxyType[str, type[Bahr]] = MappingProxyType({
+    "taweel": Taweel,
+    "madeed": Madeed,
+    "baseet": Baseet,
+    "wafer": Wafer,
+    "kamel": Kamel,
+    "hazaj": Hazaj,
+    "rajaz": Rajaz,
+    "ramal": Ramal,
+    "saree": Saree,
+    "munsareh": Munsareh,
+    "khafeef": Khafeef,
+    "mudhare": Mudhare,
+    "muqtadheb": Muqtadheb,
+    "mujtath": Mujtath,
+    "mutakareb": Mutakareb,
+    "mutadarak": Mutadarak,
+})
+
+
 def get_all_meters():
-    return {
-        "taweel": Taweel,
-        "madeed": Madeed,
-        "baseet": Baseet,
-        "wafer": Wafer,
-        "kamel": Kamel,
-        "hazaj": Hazaj,
-        "rajaz": Rajaz,
-        "ramal": Ramal,
-        "saree": Saree,
-        "munsareh": Munsareh,
-        "khafeef": Khafeef,
-        "mudhare": Mudhare,
-        "muqtadheb": Muqtadheb,
-        "mujtath": Mujtath,
-        "mutakareb": Mutakareb,
-        "mutadarak": Mutadarak,
-    }
+    """Returns a read-only mapping of meter names to their Bahr classes."""
+    return _ALL_METERS
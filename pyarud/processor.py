@@ -1,9 +1,47 @@
+import functools
 import math
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 
 from .arudi import ArudiConverter
-from .bahr import get_all_meters
+from .bahr import _copy_pattern_rows, get_all_meters
+
+
+@functools.lru_cache(maxsize=65536)
+def _similarity(a, b):
+    # Use cubic scaling to penalize small mismatches more heavily.
+    # A 0.95 raw ratio becomes ~0.73, increasing separation significantly.
+    # Patterns are short "0"/"1" strings and the same pairs recur across meters,
+    # candidates and verses, so results are memoized. SequenceMatcher is not
+    # guaranteed symmetric, so (a, b) and (b, a) are kept as separate keys.
+    return math.pow(SequenceMatcher(None, a, b).ratio(), 6)
+
+
+# Tie-breaker between meters with the same rounded score and pair validity
+METER_PRIORITY = {
+    "rajaz": 20,
+    "kamel": 10,
+    "hazaj": 20,
+    "wafer": 10,
+    "saree": 20,
+    "munsareh": 10,
+    "baseet": 10,
+    "ramal": 15,
+    "mutadarak": 15,
+    "mutakareb": 15,
+}
+
+# Processor used by process_poem worker processes (set once per process)
+_worker_processor = None
+
+
+def _init_worker(processor):
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _detect_in_worker(i, sadr, ajuz, meter_name):
+    return _worker_processor._detect_verse(i, sadr, ajuz, meter_name)
 
 
 class ArudhProcessor:
@@ -18,7 +56,7 @@ class ArudhProcessor:
     """
     def __init__(self):
         self.converter = ArudiConverter()
-        self.meter_classes = get_all_meters()
+        self.meter_classes = dict(get_all_meters())
         self.precomputed_patterns = {}
         self._precompute_patterns()
 
@@ -28,15 +66,33 @@ class ArudhProcessor:
         """
         for name, bahr_cls in self.meter_classes.items():
             bahr_instance = bahr_cls()
-            # detailed_patterns returns {'sadr': [...], 'ajuz': [...], 'pairs': set()}
-            self.precomputed_patterns[name] = bahr_instance.detailed_patterns
-
-    def _get_similarity(self, a, b):
-        # Use cubic scaling to penalize small mismatches more heavily.
-        # A 0.95 raw ratio becomes ~0.73, increasing separation significantly.
-        return math.pow(SequenceMatcher(None, a, b).ratio(), 6)
-
-    def process_poem(self, verses, meter_name=None):
+            # Same tables as detailed_patterns ({'sadr': [...], 'ajuz': [...], 'pairs': set()}),
+            # read from the per-class cache; everything stored below is this processor's own
+            patterns = bahr_instance._shared_detailed_patterns()
+            # Matching keeps the first reference with the best score, and equal patterns
+            # score equally, so only the first reference per distinct pattern is scanned
+            self.precomputed_patterns[name] = {
+                "sadr": self._first_per_pattern(patterns["sadr"]),
+                "ajuz": self._first_per_pattern(patterns["ajuz"]),
+                "pairs": set(patterns["pairs"]),
+                # Allowed feet per position, longest first as tried by _analyze_feet
+                "allowed_sadr": self._longest_first(bahr_instance._shared_allowed_feet_patterns(0)),
+                "allowed_ajuz": self._longest_first(bahr_instance._shared_allowed_feet_patterns(1)),
+            }
+
+    @staticmethod
+    def _first_per_pattern(items):
+        seen = {}
+        for item in items:
+            if item["pattern"] not in seen:
+                seen[item["pattern"]] = _copy_pattern_rows([item])[0]
+        return list(seen.values())
+
+    @staticmethod
+    def _longest_first(allowed_feet):
+        return [sorted(forms, key=len, reverse=True) for forms in allowed_feet]
+
+    def process_poem(self, verses, meter_name=None, workers=1):
         """
         Analyzes a list of verses to detect the meter and evaluate prosodic correctness.
 
@@ -45,6 +101,11 @@ class ArudhProcessor:
                 the Sadr (first hemistich) and Ajuz (second hemistich) of a verse.
             meter_name (str, optional): The name of a specific meter to force the analysis against.
                 If provided, auto-detection is skipped. Defaults to None.
+            workers (int): Number of worker processes for the per-verse detection step. With
+                more than one, this processor is pickled and sent once to each process: its
+                class, converter (including custom spellings), `meter_classes` and
+                `precomputed_patterns` all carry over, so results match `workers=1`. A subclass
+                must be importable by the workers. Worth it for long poems only. Defaults to 1.
 
         Returns:
             dict: A dictionary containing:
@@ -54,72 +115,34 @@ class ArudhProcessor:
                     - `sadr_analysis` (list[dict]): Detailed foot-by-foot analysis of the Sadr.
                     - `ajuz_analysis` (list[dict]): Detailed foot-by-foot analysis of the Ajuz.
         """
-        detected_counts = Counter()
-        temp_results = []
-
         # 1. Detect Meter for each verse (if not forced)
-        for i, (sadr, ajuz) in enumerate(verses):
-            # Convert text to pattern
-            # Generate candidates for Sadr: Saturated (Standard) and Unsaturated (Mudawwar/Fragment)
-            sadr_res_sat = self.converter.prepare_text(sadr, saturate=True)
-            sadr_res_unsat = self.converter.prepare_text(sadr, saturate=False)
-            
-            # Generate candidates for Ajuz: Saturated (Mutlaq) and Unsaturated (Muqayyad)
-            ajuz_res_sat = self.converter.prepare_text(ajuz, saturate=True)
-            ajuz_res_unsat = self.converter.prepare_text(ajuz, saturate=False, muqayyad=True)
-            
-            # Handle single shatr input if needed (future proofing)
-            if not ajuz:
-                ajuz_res_sat = ("", "")
-                ajuz_res_unsat = ("", "")
-
-            match_info = None
-            
-            # Collect candidates: [(arudi_text, pattern), ...]
-            sadr_candidates = [sadr_res_sat]
-            if sadr_res_unsat[1] != sadr_res_sat[1]:
-                sadr_candidates.append(sadr_res_unsat)
-                
-            ajuz_candidates = [ajuz_res_sat]
-            if ajuz_res_unsat[1] != ajuz_res_sat[1]:
-                ajuz_candidates.append(ajuz_res_unsat)
-
-            # Find best meter (or best fit for forced meter)
-            candidates = self._find_best_meter(sadr_candidates, ajuz_candidates, target_meter=meter_name)
-            if candidates:
-                best_match = candidates[0]
-                detected_counts[best_match["meter"]] += 1
-                match_info = best_match
-            
-            # Determine which candidates won
-            chosen_sadr = sadr_candidates[0] # Default
-            chosen_ajuz = ajuz_candidates[0] # Default
-            
-            if match_info:
-                if "sadr_input_pattern" in match_info:
-                     for cand in sadr_candidates:
-                         if cand[1] == match_info["sadr_input_pattern"]:
-                             chosen_sadr = cand
-                             break
-                if "ajuz_input_pattern" in match_info:
-                     for cand in ajuz_candidates:
-                         if cand[1] == match_info["ajuz_input_pattern"]:
-                             chosen_ajuz = cand
-                             break
-            
-            temp_results.append(
-                {
-                    "index": i,
-                    "sadr": {"text": sadr, "pattern": chosen_sadr[1], "arudi": chosen_sadr[0]},
-                    "ajuz": {"text": ajuz, "pattern": chosen_ajuz[1], "arudi": chosen_ajuz[0]},
-                    "match": match_info,
-                }
-            )
+        if workers <= 1:
+            temp_results = [self._detect_verse(i, sadr, ajuz, meter_name) for i, (sadr, ajuz) in enumerate(verses)]
+        else:
+            verses = list(verses)
+            chunksize = max(1, len(verses) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+                temp_results = list(
+                    pool.map(
+                        functools.partial(_detect_in_worker, meter_name=meter_name),
+                        range(len(verses)),
+                        [sadr for sadr, _ in verses],
+                        [ajuz for _, ajuz in verses],
+                        chunksize=chunksize,
+                    )
+                )
+
+        detected_counts = {}
+        for res in temp_results:
+            if res["match"]:
+                meter = res["match"]["meter"]
+                detected_counts[meter] = detected_counts.get(meter, 0) + 1
 
         if meter_name:
             global_meter = meter_name
         elif detected_counts:
-            global_meter = detected_counts.most_common(1)[0][0]
+            # Ties go to the meter detected first, as with Counter.most_common
+            global_meter = max(detected_counts, key=detected_counts.__getitem__)
         else:
             return {"error": "Could not detect any valid meter."}
 
@@ -131,20 +154,64 @@ class ArudhProcessor:
 
         return {"meter": global_meter, "verses": final_analysis}
 
-    def _find_best_meter(self, sadr_candidates, ajuz_candidates, target_meter=None):
-        METER_PRIORITY = {
-            "rajaz": 20,
-            "kamel": 10,
-            "hazaj": 20,
-            "wafer": 10,
-            "saree": 20,
-            "munsareh": 10,
-            "baseet": 10,
-            "ramal": 15,
-            "mutadarak": 15,
-            "mutakareb": 15,
+    def _detect_verse(self, i, sadr, ajuz, meter_name=None):
+        """
+        Converts one verse and finds its best matching meter (or the forced one).
+        """
+        # Convert text to pattern
+        # Generate candidates for Sadr: Saturated (Standard) and Unsaturated (Mudawwar/Fragment)
+        sadr_res_sat = self.converter.prepare_text(sadr, saturate=True)
+        sadr_res_unsat = self.converter.prepare_text(sadr, saturate=False)
+        
+        # Generate candidates for Ajuz: Saturated (Mutlaq) and Unsaturated (Muqayyad)
+        ajuz_res_sat = self.converter.prepare_text(ajuz, saturate=True)
+        ajuz_res_unsat = self.converter.prepare_text(ajuz, saturate=False, muqayyad=True)
+        
+        # Handle single shatr input if needed (future proofing)
+        if not ajuz:
+            ajuz_res_sat = ("", "")
+            ajuz_res_unsat = ("", "")
+
+        match_info = None
+        
+        # Collect candidates: [(arudi_text, pattern), ...]
+        sadr_candidates = [sadr_res_sat]
+        if sadr_res_unsat[1] != sadr_res_sat[1]:
+            sadr_candidates.append(sadr_res_unsat)
+            
+        ajuz_candidates = [ajuz_res_sat]
+        if ajuz_res_unsat[1] != ajuz_res_sat[1]:
+            ajuz_candidates.append(ajuz_res_unsat)
+
+        # Find best meter (or best fit for forced meter)
+        candidates = self._find_best_meter(sadr_candidates, ajuz_candidates, target_meter=meter_name)
+        if candidates:
+            match_info = candidates[0]
+        
+        # Determine which candidates won
+        chosen_sadr = sadr_candidates[0] # Default
+        chosen_ajuz = ajuz_candidates[0] # Default
+        
+        if match_info:
+            if "sadr_input_pattern" in match_info:
+                 for cand in sadr_candidates:
+                     if cand[1] == match_info["sadr_input_pattern"]:
+                         chosen_sadr = cand
+                         break
+            if "ajuz_input_pattern" in match_info:
+                 for cand in ajuz_candidates:
+                     if cand[1] == match_info["ajuz_input_pattern"]:
+                         chosen_ajuz = cand
+                         break
+        
+        return {
+            "index": i,
+            "sadr": {"text": sadr, "pattern": chosen_sadr[1], "arudi": chosen_sadr[0]},
+            "ajuz": {"text": ajuz, "pattern": chosen_ajuz[1], "arudi": chosen_ajuz[0]},
+            "match": match_info,
         }
 
+    def _find_best_meter(self, sadr_candidates, ajuz_candidates, target_meter=None):
         candidates = []
         
         meters_to_check = self.precomputed_patterns.items()
@@ -154,7 +221,15 @@ class ArudhProcessor:
             else:
                 return []
 
+        # Once a meter matches perfectly with a valid pair, only a meter with a higher
+        # priority can still outrank it, so the rest are not scored
+        perfect_priority = None
+
         for name, patterns in meters_to_check:
+            priority = METER_PRIORITY.get(name, 0)
+            if perfect_priority is not None and priority <= perfect_priority:
+                continue
+
             # 1. Score Sadr candidates and pick best for this meter
             best_sadr = None
             best_sadr_score = -1
@@ -213,6 +288,9 @@ class ArudhProcessor:
                 "ajuz_input_pattern": best_ajuz_input
             })
 
+            if total_score == 1.0 and is_valid_pair:
+                perfect_priority = priority
+
         # Sort candidates
         candidates.sort(key=lambda x: (
             round(x["score"], 3),
@@ -231,7 +309,10 @@ class ArudhProcessor:
         
         for item in component_patterns:
             ref_pat = item["pattern"]
-            score = self._get_similarity(ref_pat, input_pattern)
+            if ref_pat == input_pattern:
+                # Only identical patterns score 1.0, so nothing later can beat this
+                return {"score": 1.0, "ref": item}
+            score = _similarity(ref_pat, input_pattern)
             if score > best_score:
                 best_score = score
                 best_ref = item
@@ -244,19 +325,20 @@ class ArudhProcessor:
         if not patterns:
             return {"error": "Meter data not found"}
 
-        sadr_match = self._find_best_component_match(res["sadr"]["pattern"], patterns["sadr"])
-        ajuz_match = None
-        if res["ajuz"]["pattern"]:
-            ajuz_match = self._find_best_component_match(res["ajuz"]["pattern"], patterns["ajuz"])
+        detected = res["match"]
+        if detected and detected["meter"] == meter_name:
+            # Detection already matched these exact patterns against this meter
+            sadr_match = detected["sadr_match"]
+            ajuz_match = detected["ajuz_match"] if res["ajuz"]["pattern"] else None
+        else:
+            sadr_match = self._find_best_component_match(res["sadr"]["pattern"], patterns["sadr"])
+            ajuz_match = None
+            if res["ajuz"]["pattern"]:
+                ajuz_match = self._find_best_component_match(res["ajuz"]["pattern"], patterns["ajuz"])
 
         # Get allowed feet for this meter for greedy analysis
-        bahr_cls = self.meter_classes.get(meter_name)
-        allowed_sadr = []
-        allowed_ajuz = []
-        if bahr_cls:
-            inst = bahr_cls()
-            allowed_sadr = inst.get_allowed_feet_patterns(0)
-            allowed_ajuz = inst.get_allowed_feet_patterns(1)
+        allowed_sadr = patterns["allowed_sadr"]
+        allowed_ajuz = patterns["allowed_ajuz"]
 
         # Analyze Sadr Feet
         sadr_analysis = self._analyze_feet(res["sadr"]["pattern"], allowed_sadr, sadr_match["ref"])
@@ -302,9 +384,7 @@ class ArudhProcessor:
             else:
                 candidates = []
             
-            # Sort candidates by length descending to try longest match first
-            candidates = sorted(candidates, key=len, reverse=True)
-            
+            # Candidates are ordered by length descending to try longest match first
             best_local_match = None
             best_local_score = -1
             
@@ -318,15 +398,13 @@ class ArudhProcessor:
                 if not segment:
                     break  # No more input
                 
-                score = self._get_similarity(cand, segment)
-                
-                # Boost score if lengths match (to prefer aligning valid feet)
-                if len(segment) == cand_len:
-                    if score == 1.0:
-                        # Found perfect match, take it immediately
-                        best_local_match = cand
-                        best_local_score = 1.0
-                        break
+                if segment == cand:
+                    # Found perfect match, take it immediately
+                    best_local_match = cand
+                    best_local_score = 1.0
+                    break
+
+                score = _similarity(cand, segment)
                 
                 if score > best_local_score:
                     best_local_score = score
@@ -359,7 +437,7 @@ class ArudhProcessor:
             actual_segment = input_pattern[current_idx : end_idx]
             
             # Recalculate score on the final decided segment
-            final_score = self._get_similarity(best_local_match, actual_segment)
+            final_score = _similarity(best_local_match, actual_segment)
             
             status = "ok" if final_score == 1.0 else "broken"
             if not actual_segment:
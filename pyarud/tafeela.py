@@ -36,29 +36,42 @@ class Tafeela:
     def _manage_sukun_char(self):
         pass
 
+    def clone(self):
+        """Returns an independent copy, without re-running __init__."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.original_pattern = self.original_pattern[:]
+        clone.pattern = self.pattern[:]
+        return clone
+
+    def _sync_pattern_int(self):
+        # Same value as int("".join(map(str, self.pattern))), without the string round-trip
+        value = 0
+        for digit in self.pattern:
+            value = value * 10 + digit
+        self.pattern_int = value
+
     def delete_from_pattern(self, index):
         if 0 <= index < len(self.pattern):
             del self.pattern[index]
-            self.pattern_int = int("".join(map(str, self.pattern)))
+            self._sync_pattern_int()
 
     def add_to_pattern(self, index, number, char_mask):
         self.pattern.insert(index, number)
-        self.pattern_int = int("".join(map(str, self.pattern)))
+        self._sync_pattern_int()
 
     def edit_pattern_at_index(self, index, number):
         if 0 <= index < len(self.pattern):
             self.pattern[index] = number
-            self.pattern_int = int("".join(map(str, self.pattern)))
+            self._sync_pattern_int()
 
     def all_zehaf_tafeela_forms(self):
         forms = [self]
         for zehaf_class in self.allowed_zehafs:
             try:
                 zehaf = zehaf_class(self)
-                # Create a deep copy or new instance for the transformation
-                # The Zehaf class takes a tafeela in constructor and modifies it in place
-                # But wait, Zehaf logic: self.tafeela = deepcopy(tafeela)
-                # So we get a new modified instance.
+                # The Zehaf class clones the tafeela in its constructor and modifies
+                # the clone in place, so we get a new modified instance.
                 forms.append(zehaf.modified_tafeela)
             except AssertionError:
                 continue
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from pyarabic.araby import ALEF, NOON, TEH
 
 
@@ -7,7 +5,7 @@ class BaseEllahZehaf:
     """Base class for all Zehaf (changes) and Ellah (causes/defects)."""
 
     def __init__(self, tafeela):
-        self.tafeela = deepcopy(tafeela)
+        self.tafeela = tafeela.clone()
         self._modified = False
 
     def modify_tafeela(self):
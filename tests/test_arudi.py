@@ -0,0 +1,93 @@
+from pyarud.arudi import ArudiConverter
+
+# --- 1. prepare_text Cache ---
+
+def test_custom_spelling_invalidates_cache():
+    converter = ArudiConverter()
+    text = "قَالَ لَهُ"
+
+    before = converter.prepare_text(text)
+    converter.register_custom_spelling("قال", "قَالَا")
+    after = converter.prepare_text(text)
+
+    assert after != before
+    assert after == ("قالا لهو", "1010110")
+
+def test_prepare_cache_evicts_least_recently_used():
+    converter = ArudiConverter()
+    converter._prepare_cache_size = 2
+
+    converter.prepare_text("قَالَ لَهُ")
+    converter.prepare_text("قُلْ لَهُ")
+    # Touch the first text so the second one becomes the oldest entry
+    converter.prepare_text("قَالَ لَهُ")
+    converter.prepare_text("قَالَ الْفَتَى")
+
+    cached_texts = [key[0] for key in converter._prepare_cache]
+    assert cached_texts == ["قَالَ لَهُ", "قَالَ الْفَتَى"]
+
+# --- 2. Batch Conversion ---
+
+BATCH_TEXTS = [
+    "قَالَ لَهُ",
+    "أَخِي جَاوَزَ الظَّالِمُونَ الْمَدَى",
+    "بَحْرٌ سَرِيعٌ مَا لَهُ سَاحِلُ",
+    "قُلْ لَهُ",
+    "يَا صَاحِبِي قِفْ وَاسْتَمِعْ قَوْلِي لَكَا",
+]
+
+def test_prepare_texts_matches_prepare_text():
+    converter = ArudiConverter()
+    expected = [converter.prepare_text(t) for t in BATCH_TEXTS]
+
+    assert converter.prepare_texts(BATCH_TEXTS) == expected
+    assert converter.prepare_texts(BATCH_TEXTS, saturate=False, muqayyad=True) == [
+        converter.prepare_text(t, saturate=False, muqayyad=True) for t in BATCH_TEXTS
+    ]
+
+def test_prepare_texts_workers_keep_order():
+    converter = ArudiConverter()
+    expected = [converter.prepare_text(t) for t in BATCH_TEXTS]
+
+    results = converter.prepare_texts((t for t in BATCH_TEXTS), workers=2)
+
+    assert results == expected
+
+def test_prepare_texts_workers_use_custom_spellings():
+    converter = ArudiConverter()
+    converter.register_custom_spelling("قال", "قَالَا")
+
+    results = converter.prepare_texts(["قَالَ لَهُ"], workers=2)
+
+    assert results == [("قالا لهو", "1010110")]
+
+# --- 3. CHANGE_LST ---
+
+def test_direct_change_lst_write_applies_to_prefixed_words():
+    converter = ArudiConverter()
+    converter.CHANGE_LST["قال"] = "قَالَا"
+
+    assert converter.prepare_text("فَقَالَ لَهُ") == ("فقالا لهو", "11010110")
+
+    del converter.CHANGE_LST["قال"]
+
+    assert converter.prepare_text("وَقَالَ لَهُ") == ("وقال لهو", "1101110")
+
+def test_direct_change_lst_write_clears_word_cache():
+    converter = ArudiConverter()
+    converter.prepare_text("قَالَ لَهُ")
+
+    converter.CHANGE_LST["قال"] = "قَالَا"
+
+    # A new line reusing the cached word picks up the new spelling
+    assert converter.prepare_text("قَالَ لَنَا")[0].startswith("قالا ")
+
+def test_direct_change_lst_write_invalidates_prepare_cache():
+    converter = ArudiConverter()
+    text = "قَالَ لَهُ"
+
+    before = converter.prepare_text(text)
+    converter.CHANGE_LST["قال"] = "قَالَا"
+
+    assert before == ("قال لهو", "101110")
+    assert converter.prepare_text(text) == ("قالا لهو", "1010110")
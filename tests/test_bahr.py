@@ -0,0 +1,56 @@
+from pyarud.bahr import Taweel
+from pyarud.processor import ArudhProcessor
+
+TAWEEL_VERSE = ("طَوِيلٌ لَهُ دُونَ البُحُورِ فَضَائِلُ", "فَعُولُنْ مَفَاعِيلُنْ فَعُولُنْ مَفَاعِلُ")
+
+# --- 1. Cached Pattern Tables ---
+
+def test_mutating_results_does_not_leak_between_instances():
+    first = Taweel()
+    expected_patterns = Taweel().detailed_patterns
+    expected_allowed = Taweel().get_allowed_feet_patterns(0)
+    expected_bait = Taweel().bait_combinations
+
+    patterns = first.detailed_patterns
+    patterns["pairs"].clear()
+    patterns["sadr"][0]["feet"].append("1")
+    patterns["ajuz"].clear()
+    first.get_allowed_feet_patterns(0)[0].clear()
+    first.bait_combinations.clear()
+
+    second = Taweel()
+    assert second.detailed_patterns == expected_patterns
+    assert second.get_allowed_feet_patterns(0) == expected_allowed
+    assert second.bait_combinations == expected_bait
+
+def test_mutating_results_does_not_affect_processor():
+    processor = ArudhProcessor()
+    Taweel().detailed_patterns["pairs"].clear()
+
+    sadr, ajuz = TAWEEL_VERSE
+    for proc in (processor, ArudhProcessor()):
+        sadr_candidates = [proc.converter.prepare_text(sadr)]
+        ajuz_candidates = [proc.converter.prepare_text(ajuz)]
+        match = proc._find_best_meter(sadr_candidates, ajuz_candidates, target_meter="taweel")[0]
+        assert match["valid_pair"]
+
+def test_mutating_processor_tables_does_not_leak():
+    expected = Taweel().detailed_patterns
+
+    tables = ArudhProcessor().precomputed_patterns["taweel"]
+    tables["pairs"].clear()
+    tables["sadr"][0]["feet"].clear()
+    tables["ajuz"][0]["pattern"] = ""
+
+    assert Taweel().detailed_patterns == expected
+    assert ArudhProcessor().process_poem([TAWEEL_VERSE])["verses"][0]["score"] >= 0.95
+    fresh = ArudhProcessor().precomputed_patterns["taweel"]
+    assert fresh["pairs"] == expected["pairs"]
+
+def test_mutating_hashw_forms_does_not_leak():
+    expected = [[str(f) for f in forms] for forms in Taweel().get_shatr_hashw_combinations()]
+
+    form = Taweel().get_shatr_hashw_combinations()[0][0]
+    form.edit_pattern_at_index(0, 0)
+
+    assert [[str(f) for f in forms] for forms in Taweel().get_shatr_hashw_combinations()] == expected